@@ -8,9 +8,109 @@ import os
 import sys
 import stat
 import re
+import time
+import operator
 import fnmatch
 from datetime import datetime, timedelta
 import subprocess
+import threading
+import queue
+
+try:
+    import liburing
+except ImportError: # io_uring stat batching is optional; fall back to serial stats
+    liburing = None
+
+try:
+    import hyperscan
+except ImportError: # DFA-based -regex matching is optional; fall back to re
+    hyperscan = None
+
+try:
+    import pwd
+    import grp
+except ImportError: # Non-POSIX platform; -ls prints numeric ids
+    pwd = grp = None
+
+# Number of statx submissions batched into one io_uring_enter round trip.
+_STATX_BATCH = 256
+
+# Output accumulates in a bytearray and is written in chunks of this size,
+# instead of one locked, line-buffered write per matching path.
+_OUT_BUF_SIZE = 64 * 1024
+
+def _io_uring_available():
+    """True when the optional liburing backend can be used (Linux >= 5.6)."""
+    if liburing is None or sys.platform != 'linux':
+        return False
+    try:
+        major, minor = (int(p) for p in os.uname().release.split('.')[:2])
+    except (ValueError, OSError):
+        return False
+    return (major, minor) >= (5, 6) # IORING_OP_STATX landed in 5.6
+
+class _TestNode:
+    """AST leaf for a test primary such as -name or -size."""
+    __slots__ = ('name', 'fn', 'args')
+
+    def __init__(self, name, fn, args):
+        self.name = name
+        self.fn = fn
+        self.args = args
+
+class _ActionNode:
+    """AST leaf for an action primary such as -print or -exec."""
+    __slots__ = ('name', 'fn', 'args')
+
+    def __init__(self, name, fn, args):
+        self.name = name
+        self.fn = fn
+        self.args = args
+
+class _NotNode:
+    """AST node for ! / -not."""
+    __slots__ = ('child',)
+
+    def __init__(self, child):
+        self.child = child
+
+class _AndNode:
+    """AST node for -a / -and (and the implicit and)."""
+    __slots__ = ('children',)
+
+    def __init__(self, children):
+        self.children = children
+
+class _OrNode:
+    """AST node for -o / -or."""
+    __slots__ = ('children',)
+
+    def __init__(self, children):
+        self.children = children
+
+class _CommaNode:
+    """AST node for the ',' operator: evaluate all, keep the last result."""
+    __slots__ = ('children',)
+
+    def __init__(self, children):
+        self.children = children
+
+class _StatxResult:
+    """Minimal os.stat_result stand-in built from a statx completion."""
+    __slots__ = ('st_mode', 'st_ino', 'st_nlink', 'st_uid', 'st_gid',
+                 'st_size', 'st_blocks', 'st_atime', 'st_mtime', 'st_ctime')
+
+    def __init__(self, stx):
+        self.st_mode = stx.mode
+        self.st_ino = stx.ino
+        self.st_nlink = stx.nlink
+        self.st_uid = stx.uid
+        self.st_gid = stx.gid
+        self.st_size = stx.size
+        self.st_blocks = stx.blocks
+        self.st_atime = stx.atime
+        self.st_mtime = stx.mtime
+        self.st_ctime = stx.ctime
 
 class FindMimic:
     """
@@ -20,6 +120,26 @@ class FindMimic:
         self.paths, self.expression_tokens = self._parse_initial_args(args)
         self.pos = 0
         self.prune_paths = set()
+        self._current_entry = None
+        self._basename = ''
+        self._stat_cache = {}
+
+        self._out_buf = bytearray()
+        self._now_ts = time.time() # Refreshed at the start of run()
+
+        # -ls lookup caches: owner and group names come from the NSS stack
+        # (potentially a network call) and most files share few distinct
+        # ids, so resolve each id and minute-bucketed mtime string once.
+        self._uid_cache = {}
+        self._gid_cache = {}
+        self._ls_time_cache = {}
+
+        # Pending '-exec ... {} +' batches: (template, cwd) -> [paths, nbytes]
+        self._exec_batches = {}
+        try:
+            self._exec_arg_max = os.sysconf('SC_ARG_MAX') - 4096
+        except (ValueError, OSError):
+            self._exec_arg_max = 128 * 1024
 
         # Options with default values
         self.options = {
@@ -33,9 +153,43 @@ class FindMimic:
         # Pre-process options from the expression
         self._pre_process_options()
 
-        # If no action is specified, -print is the default.
-        if not any(arg in self._actions for arg in self.expression_tokens):
-            self.expression_tokens.append('-print')
+        # Parse the expression once into an AST and compile it into a tree
+        # of closures; evaluation per path is then a single call.
+        needs_print = not any(arg in self._actions for arg in self.expression_tokens)
+        self._ast = self._parse_expression() if self.expression_tokens else None
+        if self._peek() is not None:
+            raise ValueError(f"Unexpected token: '{self._peek()}'")
+
+        # If no action is specified, '( expression ) -print' is implied.
+        if needs_print:
+            print_node = _ActionNode('-print', self._actions['-print'], [])
+            if self._ast is None:
+                self._ast = print_node
+            else:
+                self._ast = _AndNode([self._ast, print_node])
+
+        self._sort_conjuncts(self._ast)
+        self._compiled = self._compile(self._ast)
+        self._files_only = self._analyze_files_only()
+        self._has_prune = self._contains_primary(self._ast, '-prune')
+
+        self._needs_stat = any(tok in self._stat_consumers for tok in self.expression_tokens)
+
+        # Directory scans run on a small thread pool: scandir/stat release
+        # the GIL, so kernel-side work overlaps across workers. Post-order
+        # (-depth) keeps the serial recursive walk.
+        self._eval_lock = threading.Lock()
+        self._num_workers = min(32, (os.cpu_count() or 1) * 2)
+        self._parallel = not self.options['depth'] and self._num_workers > 1
+        self._walk_exc = None
+
+        # Batch stats through io_uring only when the expression will
+        # actually consume them; the ring is single-issuer, so it is used
+        # only by the serial walk (workers warm DirEntry stats instead).
+        self._uring = None
+        self._uring_cqe = None
+        self._use_uring = (_io_uring_available() and self._needs_stat
+                           and not self._parallel)
 
     def _pre_process_options(self):
         """Parses and removes global options from the expression list before evaluation."""
@@ -86,91 +240,437 @@ class FindMimic:
 
     def run(self):
         """Starts the find process."""
-        for path in self.paths:
-            if not os.path.exists(path):
-                sys.stderr.write(f"find.py: '{path}': No such file or directory\n")
-                continue
-            self._walk(path)
+        self._now_ts = self._reference_time()
+        if self._use_uring:
+            self._init_uring()
+        try:
+            for path in self.paths:
+                if not os.path.exists(path):
+                    sys.stderr.write(f"find.py: '{path}': No such file or directory\n")
+                    continue
+                self._walk(path)
+        finally:
+            self._flush_exec_batches()
+            self._flush_output()
+            self._close_uring()
+
+    def _write_out(self, data):
+        """Appends bytes to the output buffer, draining it past the high-water mark."""
+        buf = self._out_buf
+        buf += data
+        if len(buf) >= _OUT_BUF_SIZE:
+            self._flush_output()
+
+    def _flush_output(self):
+        """Drains any buffered action output to stdout."""
+        if self._out_buf:
+            out = sys.stdout.buffer
+            out.write(self._out_buf)
+            self._out_buf.clear()
+            out.flush()
+
+    def _init_uring(self):
+        """Sets up the io_uring submission ring for batched statx, if possible."""
+        ring = liburing.Ring()
+        for flags in (liburing.IORING_SETUP_SQPOLL | liburing.IORING_SETUP_SINGLE_ISSUER, 0):
+            try:
+                liburing.io_uring_queue_init(_STATX_BATCH, ring, flags)
+            except OSError:
+                continue # SQPOLL may need privileges or a newer kernel
+            self._uring = ring
+            self._uring_cqe = liburing.Cqe()
+            return
+        self._use_uring = False
+
+    def _close_uring(self):
+        if self._uring is not None:
+            try:
+                liburing.io_uring_queue_exit(self._uring)
+            finally:
+                self._uring = None
+
+    def _batch_stat(self, entries):
+        """Issues one batched io_uring statx round per chunk of directory entries.
+
+        Successful results land in self._stat_cache keyed by path, so the
+        expression tests see them through _get_stat without any further
+        syscalls. Entries whose statx failed are simply left uncached and
+        fall back to the lazy per-path stat.
+        """
+        ring = self._uring
+        cqe = self._uring_cqe
+        cache = self._stat_cache
+        try:
+            for start in range(0, len(entries), _STATX_BATCH):
+                chunk = entries[start:start + _STATX_BATCH]
+                stxs = [liburing.Statx() for _ in chunk]
+                prepped = 0
+                for i, entry in enumerate(chunk):
+                    sqe = liburing.io_uring_get_sqe(ring)
+                    if sqe is None:
+                        break # Ring full; the rest will be statted lazily
+                    liburing.io_uring_prep_statx(sqe, stxs[i], entry.path,
+                                                 liburing.AT_SYMLINK_NOFOLLOW)
+                    sqe.user_data = i
+                    prepped += 1
+                liburing.io_uring_submit_and_wait(ring, prepped)
+                for _ in range(prepped):
+                    liburing.io_uring_wait_cqe(ring, cqe)
+                    try:
+                        done = cqe[0]
+                        idx = done.user_data
+                        cache[(chunk[idx].path, False)] = _StatxResult(stxs[idx])
+                    except OSError:
+                        pass # Entry vanished mid-walk; _get_stat will notice
+                    liburing.io_uring_cq_advance(ring, 1)
+        except OSError:
+            # Ring malfunction: disable batching and continue serially.
+            self._use_uring = False
+            self._close_uring()
 
     def _walk(self, start_path):
-        """Walks the directory tree and applies the expression."""
+        """Walks the directory tree rooted at start_path and applies the expression."""
+        max_depth = self.options['maxdepth']
+        min_depth = self.options['mindepth']
+        post_order = self.options['depth']
+
+        # The start path itself is at depth 0.
+        start_is_dir = os.path.isdir(start_path) and not os.path.islink(start_path)
+        skip_start = self._files_only and start_is_dir
+        if not post_order and min_depth <= 0 and not skip_start:
+            self._evaluate_expression(start_path)
+            if self._has_prune and start_path in self.prune_paths:
+                return
+        # Children live at depth 1; don't scan them at all under -maxdepth 0.
+        if max_depth >= 1 and os.path.isdir(start_path):
+            if self._parallel:
+                self._scan_parallel(start_path, 1)
+            else:
+                self._scan(start_path, 1)
+        if post_order and min_depth <= 0 and not skip_start:
+            self._evaluate_expression(start_path)
+
+    def _read_dir(self, dir_path):
+        """Lists dir_path and primes the stat cache for its entries.
+
+        Stats are cached per directory so one io_uring batch can cover
+        every entry about to be evaluated. Returns None if the directory
+        cannot be read.
+        """
+        try:
+            with os.scandir(dir_path) as it:
+                entries = list(it)
+        except OSError as e:
+            sys.stderr.write(f"find.py: '{dir_path}': {e.strerror}\n")
+            return None
+        self._stat_cache.clear()
+        if self._use_uring and entries:
+            self._batch_stat(entries)
+        return entries
+
+    def _scan(self, dir_path, depth):
+        """Scans the tree under dir_path, evaluating entries starting at `depth`.
+
+        Iterative depth-first walk over an explicit stack, so tree depth is
+        never bounded by the interpreter recursion limit. Each frame is
+        [entries, next_index, depth, pending]; descending into a directory
+        pushes a new frame, and under -depth the directory's own entry is
+        parked in `pending` so it is evaluated when its frame is popped —
+        the same pre-/post-order interleaving the recursive walk produced.
+        """
         max_depth = self.options['maxdepth']
         min_depth = self.options['mindepth']
         follow_links = self.options['follow']
-        use_depth_first = self.options['depth']
-
-        # os.walk depth is relative to the start_path
-        start_level = start_path.count(os.sep)
-
-        if use_depth_first:
-            # Post-order traversal
-            for root, dirs, files in os.walk(start_path, topdown=False, followlinks=follow_links):
-                current_level = root.count(os.sep) - start_level
-                
-                # Process files at the current level
-                if current_level + 1 >= min_depth and current_level < max_depth:
-                    for name in files:
-                        path = os.path.join(root, name)
-                        self.pos = 0
-                        self._evaluate_expression(path)
-
-                # Process directories at the current level
-                if current_level >= min_depth and current_level < max_depth:
-                     for name in dirs:
-                        path = os.path.join(root, name)
-                        self.pos = 0
-                        self._evaluate_expression(path)
-            
-            # Process the start path itself
-            if min_depth == 0:
-                self.pos = 0
-                self._evaluate_expression(start_path)
+        post_order = self.options['depth']
 
-        else:
-            # Pre-order traversal
-            for root, dirs, files in os.walk(start_path, topdown=True, followlinks=follow_links):
-                # Pruning logic
-                dirs[:] = [d for d in dirs if os.path.join(root, d) not in self.prune_paths]
-
-                current_level = root.count(os.sep) - start_level
-                
-                # Process the root of this walk iteration
-                if current_level >= min_depth and current_level <= max_depth:
-                    self.pos = 0
-                    if self._evaluate_expression(root):
-                        # If prune is triggered, it's handled by the expression evaluation
-                        if root in self.prune_paths:
-                            dirs[:] = [] # Clear dirs to stop descending
-                            continue
-                
-                # Stop descending if maxdepth is reached
-                if current_level >= max_depth:
-                    dirs[:] = []
-
-                # Process files and directories
-                if current_level < max_depth:
-                    for name in files:
-                        if current_level + 1 >= min_depth:
-                            path = os.path.join(root, name)
-                            self.pos = 0
-                            self._evaluate_expression(path)
-                    for name in dirs:
-                        if current_level + 1 >= min_depth:
-                            path = os.path.join(root, name)
-                            self.pos = 0
-                            # Evaluate for potential pruning of subdirectories
-                            if self._evaluate_expression(path) and path in self.prune_paths:
-                                # This dir is pruned, but it's tricky to remove from dirs now
-                                # The check at the start of the loop handles it
-                                pass
-
-
-    def _evaluate_expression(self, path):
-        """Evaluates the expression for a given path using recursive descent."""
-        self.pos = 0 # Reset for each path
-        return self._parse_or_expr(path)
-
-    # --- Recursive Descent Parser for find expressions ---
+        entries = self._read_dir(dir_path)
+        if entries is None:
+            return
+
+        # Hot loop: bind everything consulted per entry to locals so each
+        # iteration costs no repeated attribute or dict lookups on self.
+        files_only = self._files_only
+        evaluate = self._evaluate_expression
+        read_dir = self._read_dir
+        # Skip prune-set lookups entirely when the expression has no -prune.
+        prune_paths = self.prune_paths if self._has_prune else None
+
+        stack = [[entries, 0, depth, None]]
+        while stack:
+            frame = stack[-1]
+            entries, depth = frame[0], frame[2]
+            in_range = depth >= min_depth
+            descend = depth < max_depth
+            if frame[3] is not None:
+                # Post-order visit owed to the directory whose subtree
+                # just finished.
+                entry, skip_entry = frame[3]
+                frame[3] = None
+                if in_range and not skip_entry:
+                    evaluate(entry.path, entry)
+            i = frame[1]
+            n = len(entries)
+            pushed = False
+            while i < n:
+                entry = entries[i]
+                i += 1
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=follow_links)
+                except OSError:
+                    is_dir = False
+                skip_entry = files_only and is_dir
+
+                if not post_order and in_range and not skip_entry:
+                    evaluate(entry.path, entry)
+                    # Membership test only once -prune has actually fired.
+                    if prune_paths and is_dir and entry.path in prune_paths:
+                        continue
+                if is_dir and descend:
+                    sub_entries = read_dir(entry.path)
+                    if sub_entries is not None:
+                        frame[1] = i
+                        if post_order:
+                            frame[3] = (entry, skip_entry)
+                        stack.append([sub_entries, 0, depth + 1, None])
+                        pushed = True
+                        break
+                if post_order and in_range and not skip_entry:
+                    evaluate(entry.path, entry)
+            if not pushed:
+                stack.pop()
+
+    def _scan_parallel(self, start_dir, depth):
+        """Walks pre-order with a pool of worker threads.
+
+        Workers take directories off a shared queue, scan them, and queue
+        the subdirectories back; directory I/O overlaps across workers
+        while expression evaluation serializes under _eval_lock. The first
+        exception raised in a worker — -quit's SystemExit or any evaluation
+        error — is recorded in _walk_exc and re-raised here once the pool
+        drains; -quit is recorded under the lock so no other worker can
+        produce further matches.
+        """
+        tasks = queue.Queue()
+        tasks.put((start_dir, depth))
+        self._walk_exc = None
+
+        def worker():
+            while True:
+                item = tasks.get()
+                if item is None:
+                    break
+                try:
+                    if self._walk_exc is None:
+                        self._scan_one_dir(item[0], item[1], tasks)
+                except SystemExit:
+                    pass  # Recorded in _walk_exc at the raise site.
+                except BaseException as e:
+                    # Anything else must not kill the thread silently:
+                    # that would strand tasks.join() once every worker
+                    # dies. Record it and drain the remaining work.
+                    if self._walk_exc is None:
+                        self._walk_exc = e
+                finally:
+                    tasks.task_done()
+
+        threads = [threading.Thread(target=worker, daemon=True)
+                   for _ in range(self._num_workers)]
+        for t in threads:
+            t.start()
+        tasks.join()
+        for _ in threads:
+            tasks.put(None)
+        for t in threads:
+            t.join()
+        if self._walk_exc is not None:
+            raise self._walk_exc
+
+    def _scan_one_dir(self, dir_path, depth, tasks):
+        """Scans a single directory inside a worker thread."""
+        max_depth = self.options['maxdepth']
+        min_depth = self.options['mindepth']
+        follow_links = self.options['follow']
+
+        try:
+            with os.scandir(dir_path) as it:
+                entries = list(it)
+        except OSError as e:
+            sys.stderr.write(f"find.py: '{dir_path}': {e.strerror}\n")
+            return
+
+        # Warm each DirEntry's cached stat outside the lock so the stat
+        # syscalls run concurrently across workers.
+        if self._needs_stat:
+            for entry in entries:
+                try:
+                    entry.stat(follow_symlinks=False)
+                except OSError:
+                    pass
+
+        files_only = self._files_only
+        in_range = depth >= min_depth
+        descend = depth < max_depth
+        subdirs = []
+
+        with self._eval_lock:
+            # Another worker may have hit -quit (or failed) while we
+            # waited for the lock; produce no further matches after that.
+            if self._walk_exc is not None:
+                return
+            self._stat_cache.clear()
+            evaluate = self._evaluate_expression
+            prune_paths = self.prune_paths if self._has_prune else None
+            for entry in entries:
+                if self._walk_exc is not None:
+                    return
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=follow_links)
+                except OSError:
+                    is_dir = False
+                if in_range and not (files_only and is_dir):
+                    try:
+                        evaluate(entry.path, entry)
+                    except SystemExit as e:
+                        # Record while still holding the lock so no other
+                        # worker can slip in a match first.
+                        self._walk_exc = e
+                        raise
+                    # Membership test only once -prune has actually fired.
+                    if prune_paths and is_dir and entry.path in prune_paths:
+                        continue
+                if is_dir and descend:
+                    subdirs.append(entry.path)
+
+        next_depth = depth + 1
+        for sub in subdirs:
+            tasks.put((sub, next_depth))
+
+    def _evaluate_expression(self, path, entry=None):
+        """Evaluates the compiled expression for a given path.
+
+        When called from the scandir walker, `entry` is the os.DirEntry for the
+        path; its cached stat result is reused by the tests instead of each
+        test re-statting the path.
+        """
+        self._current_entry = entry
+        # Computed once per path and shared by every -name/-iname leaf.
+        self._basename = path.rsplit(os.sep, 1)[-1]
+        return self._compiled(path)
+
+    def _get_stat(self, path, follow=False):
+        """Returns a (possibly cached) stat result for path, or None if it vanished.
+
+        The first stat of a path is performed at most once per (path, follow)
+        pair and shared by every stat-consuming primary in the expression.
+        A non-link lstat result also satisfies follow=True lookups, and the
+        DirEntry's cached stat is used when the walker provides one.
+        """
+        cache = self._stat_cache
+        key = (path, follow)
+        if key in cache:
+            return cache[key]
+        entry = self._current_entry
+        try:
+            if not follow and entry is not None and entry.path == path:
+                st = entry.stat(follow_symlinks=False)
+            elif follow:
+                st = self._get_stat(path)
+                if st is not None and not stat.S_ISLNK(st.st_mode):
+                    cache[key] = st
+                    return st
+                st = os.stat(path)
+            else:
+                st = os.lstat(path)
+        except OSError:
+            st = None # File might have been deleted between scandir and stat
+        cache[key] = st
+        return st
+
+    def _analyze_files_only(self):
+        """True when no directory can ever match or trigger a side effect.
+
+        Looks for a top-level '-type' conjunct that excludes 'd': once it
+        fails on a directory the whole conjunction short-circuits to False,
+        so evaluating the expression on directories is pure waste. Any
+        action (including -prune) encountered before such a conjunct, or
+        -L/-follow (where a symlink may classify as a directory), disables
+        the optimization.
+        """
+        if self.options['follow']:
+            return False
+        conjuncts = self._ast.children if isinstance(self._ast, _AndNode) else [self._ast]
+        for node in conjuncts:
+            if isinstance(node, _TestNode) and node.name == '-type' and 'd' not in node.args[0]:
+                return True
+            if self._contains_action(node):
+                return False
+        return False
+
+    def _contains_action(self, node):
+        """True if any action leaf occurs anywhere in the subtree."""
+        if isinstance(node, _ActionNode):
+            return True
+        if isinstance(node, _NotNode):
+            return self._contains_action(node.child)
+        if isinstance(node, (_AndNode, _OrNode, _CommaNode)):
+            return any(self._contains_action(child) for child in node.children)
+        return False
+
+    def _sort_conjuncts(self, node):
+        """Stable-sorts and-chains so cheap tests run before expensive ones.
+
+        Within each _AndNode, contiguous runs of side-effect-free children
+        are reordered by estimated cost — string tests first, then DirEntry
+        type checks, then stat- and access-requiring tests — so a failing
+        -name can skip the stat that -size or -mtime would need. Children
+        containing actions act as barriers: nothing moves across them, and
+        or/comma children keep their order (their semantics depend on it)
+        while still being sorted internally.
+        """
+        if isinstance(node, _NotNode):
+            self._sort_conjuncts(node.child)
+            return
+        if isinstance(node, (_OrNode, _CommaNode)):
+            for child in node.children:
+                self._sort_conjuncts(child)
+            return
+        if not isinstance(node, _AndNode):
+            return
+        for child in node.children:
+            self._sort_conjuncts(child)
+        ordered = []
+        run = []
+        for child in node.children:
+            if self._contains_action(child):
+                run.sort(key=self._node_cost)
+                ordered.extend(run)
+                run = []
+                ordered.append(child)
+            else:
+                run.append(child)
+        run.sort(key=self._node_cost)
+        ordered.extend(run)
+        node.children = ordered
+
+    def _node_cost(self, node):
+        """Estimated per-path evaluation cost used by _sort_conjuncts."""
+        if isinstance(node, _TestNode):
+            return self._test_costs.get(node.name, 10)
+        if isinstance(node, _NotNode):
+            return self._node_cost(node.child)
+        if isinstance(node, (_AndNode, _OrNode, _CommaNode)):
+            return max(self._node_cost(child) for child in node.children)
+        return 100 # Actions; never reordered anyway
+
+    def _contains_primary(self, node, name):
+        """True if a leaf with the given primary name occurs in the subtree."""
+        if isinstance(node, (_TestNode, _ActionNode)):
+            return node.name == name
+        if isinstance(node, _NotNode):
+            return self._contains_primary(node.child, name)
+        return any(self._contains_primary(child, name) for child in node.children)
+
+    # --- Recursive Descent Parser: builds the expression AST once ---
     def _peek(self):
         return self.expression_tokens[self.pos] if self.pos < len(self.expression_tokens) else None
 
@@ -182,90 +682,276 @@ class FindMimic:
             self.pos += 1
         return token
 
-    def _parse_or_expr(self, path):
+    def _parse_expression(self):
+        """Parses a full expression, including the ',' operator."""
+        node = self._parse_or_expr()
+        if self._peek() == ',':
+            children = [node]
+            while self._peek() == ',':
+                self._consume()
+                children.append(self._parse_or_expr())
+            node = _CommaNode(children)
+        return node
+
+    def _parse_or_expr(self):
         """Parses -o / -or expressions."""
-        left = self._parse_and_expr(path)
+        left = self._parse_and_expr()
+        children = None
         while self._peek() in ('-o', '-or'):
             self._consume()
-            # Short-circuit evaluation for 'or'
-            if left:
-                # We need to consume the right side of the expression without evaluating it
-                self._parse_and_expr(path, evaluate=False)
-                return True # The result of the OR is true
-            else:
-                right = self._parse_and_expr(path)
-                left = left or right
-        return left
+            if children is None:
+                children = [left]
+            children.append(self._parse_and_expr())
+        return _OrNode(children) if children else left
 
-    def _parse_and_expr(self, path, evaluate=True):
+    def _parse_and_expr(self):
         """Parses -a / -and expressions (and implicit 'and')."""
-        left = self._parse_not_expr(path, evaluate)
+        left = self._parse_not_expr()
+        children = None
         while self._peek() is not None and self._peek() not in ('-o', '-or', ')', ','):
             if self._peek() in ('-a', '-and'):
                 self._consume()
-            # Short-circuit evaluation for 'and'
-            if not evaluate or not left:
-                self._parse_not_expr(path, evaluate=False)
-                left = False
-            else:
-                right = self._parse_not_expr(path)
-                left = left and right
-        return left
+            if children is None:
+                children = [left]
+            children.append(self._parse_not_expr())
+        return _AndNode(children) if children else left
 
-    def _parse_not_expr(self, path, evaluate=True):
+    def _parse_not_expr(self):
         """Parses ! / -not expressions."""
         if self._peek() in ('!', '-not'):
             self._consume()
-            # If not evaluating, we still need to consume the sub-expression
-            if not evaluate:
-                self._parse_primary(path, evaluate=False)
-                return False # Dummy value
-            return not self._parse_primary(path)
-        return self._parse_primary(path, evaluate)
-
-    def _parse_primary(self, path, evaluate=True):
+            return _NotNode(self._parse_not_expr())
+        return self._parse_primary()
+
+    def _parse_primary(self):
         """Parses primaries: parentheses, tests, and actions."""
         token = self._peek()
         if token == '(':
             self._consume()
-            res = self._parse_or_expr(path)
+            node = self._parse_expression()
             self._consume(')')
-            return res
-        
+            return node
+
         if token in self._tests:
             self._consume()
-            test_func = self._tests[token]
             num_args = self._get_num_args(token)
             args = [self._consume() for _ in range(num_args)]
-            if evaluate:
-                return test_func(self, path, *args)
-            return True # For syntax-checking pass
+            if any(arg is None for arg in args):
+                raise ValueError(f"Missing argument to {token}")
+            return _TestNode(token, self._tests[token], args)
 
         if token in self._actions:
             self._consume()
-            action_func = self._actions[token]
             if token in ('-exec', '-ok', '-execdir', '-okdir'):
                 args = []
+                batched = False
                 while self._peek() != ';':
                     arg = self._consume()
                     if arg is None: raise ValueError(f"Missing ';' for {token}")
+                    # 'cmd {} +' terminates the command and requests batching.
+                    if arg == '+' and args and args[-1] == '{}' and token in self._batched_actions:
+                        batched = True
+                        break
                     args.append(arg)
-                self._consume(';')
-                if evaluate:
-                    return action_func(self, path, args)
-            else:
-                num_args = self._get_num_args(token)
-                args = [self._consume() for _ in range(num_args)]
-                if evaluate:
-                    return action_func(self, path, *args)
-            return True # For syntax-checking pass
+                if not batched:
+                    self._consume(';')
+                    return _ActionNode(token, self._actions[token], [args])
+                args.pop() # The trailing '{}' is re-added per batch
+                return _ActionNode(token, self._batched_actions[token], [args])
+            num_args = self._get_num_args(token)
+            args = [self._consume() for _ in range(num_args)]
+            if any(arg is None for arg in args):
+                raise ValueError(f"Missing argument to {token}")
+            return _ActionNode(token, self._actions[token], args)
 
         if token is None:
-            # This can happen with an implicit -a at the end
-            return True
+            raise ValueError("Expected an expression but found end of input")
 
         raise ValueError(f"Unknown expression token: {token}")
 
+    # --- Compiler: turns the AST into a tree of closures ---
+    def _compile(self, node):
+        """Compiles an AST node into a `callable(path) -> bool` closure.
+
+        Operator nodes become loops over their pre-compiled children, so
+        short-circuiting costs no parsing or dispatch per path.
+        """
+        if isinstance(node, _AndNode):
+            funcs = tuple(self._compile(child) for child in node.children)
+            def eval_and(path, _funcs=funcs):
+                for fn in _funcs:
+                    if not fn(path):
+                        return False
+                return True
+            return eval_and
+        if isinstance(node, _OrNode):
+            funcs = tuple(self._compile(child) for child in node.children)
+            def eval_or(path, _funcs=funcs):
+                for fn in _funcs:
+                    if fn(path):
+                        return True
+                return False
+            return eval_or
+        if isinstance(node, _NotNode):
+            child = self._compile(node.child)
+            return lambda path, _child=child: not _child(path)
+        if isinstance(node, _CommaNode):
+            funcs = tuple(self._compile(child) for child in node.children)
+            def eval_comma(path, _funcs=funcs):
+                result = False
+                for fn in _funcs:
+                    result = fn(path)
+                return result
+            return eval_comma
+        return self._compile_leaf(node)
+
+    def _compile_leaf(self, node):
+        """Compiles a test or action leaf into a closure over its arguments.
+
+        Primaries with a dedicated compiler get a specialized closure (e.g.
+        a pattern compiled once instead of per path); everything else falls
+        back to a generic call into the dispatch-table function.
+        """
+        compiler = self._leaf_compilers.get(node.name)
+        if compiler is not None:
+            return compiler(self, node)
+        fn = node.fn
+        args = tuple(node.args)
+        if args:
+            return lambda path, _fn=fn, _args=args: _fn(self, path, *_args)
+        return lambda path, _fn=fn: _fn(self, path)
+
+    def _compile_name(self, node):
+        """Compiles -name/-iname into a match against a pre-built regex.
+
+        The basename is taken from self._basename, computed once per path,
+        so several name tests in one expression share a single rsplit and
+        never re-derive or lowercase the string.
+        """
+        flags = re.IGNORECASE if node.name == '-iname' else 0
+        match = re.compile(fnmatch.translate(node.args[0]), flags).match
+        return lambda path, _match=match: _match(self._basename) is not None
+
+    def _compile_path(self, node):
+        """Compiles -path/-ipath (and -wholename) into a pre-built regex match."""
+        flags = re.IGNORECASE if node.name in ('-ipath', '-iwholename') else 0
+        match = re.compile(fnmatch.translate(node.args[0]), flags).match
+        return lambda path, _match=match: _match(path) is not None
+
+    def _compile_regex(self, node):
+        """Compiles -regex/-iregex; the user pattern is compiled exactly once.
+
+        Prefers Hyperscan when installed: its JIT'd DFA matches in time
+        linear in the path length with no backtracking. Patterns Hyperscan
+        cannot express (e.g. backreferences) fall back to re, as does the
+        whole test when the module is absent.
+        """
+        pattern = node.args[0]
+        ignore_case = node.name == '-iregex'
+        if hyperscan is not None:
+            try:
+                hs_flags = hyperscan.HS_FLAG_SINGLEMATCH
+                if ignore_case:
+                    hs_flags |= hyperscan.HS_FLAG_CASELESS
+                db = hyperscan.Database()
+                db.compile(expressions=[pattern.encode()], ids=[0], flags=[hs_flags])
+            except Exception: # Unsupported pattern construct
+                db = None
+            if db is not None:
+                hit = [False]
+                def on_match(_id, _start, _end, _flags, _ctx, _hit=hit):
+                    _hit[0] = True
+                def test_regex(path, _scan=db.scan, _hit=hit, _on=on_match):
+                    _hit[0] = False
+                    _scan(os.fsencode(path), match_event_handler=_on)
+                    return _hit[0]
+                return test_regex
+        flags = re.IGNORECASE if ignore_case else 0
+        search = re.compile(pattern, flags).search
+        return lambda path, _search=search: _search(path) is not None
+
+    @staticmethod
+    def _parse_num_spec(spec):
+        """Parses find's '+N'/'-N'/'N' comparand syntax once, into (cmp, N)."""
+        if spec.startswith('+'):
+            return operator.gt, int(spec[1:])
+        if spec.startswith('-'):
+            return operator.lt, int(spec[1:])
+        return operator.eq, int(spec)
+
+    def _compile_size(self, node):
+        """Compiles -size with its unit, sign and target parsed once."""
+        unit_map = {'c': 1, 'w': 2, 'k': 1024, 'M': 1024**2, 'G': 1024**3}
+        spec = node.args[0]
+        if spec and spec[-1] in unit_map:
+            mult = unit_map[spec[-1]]
+            spec = spec[:-1]
+        else:
+            mult = 512 # default blocks
+        cmp_op, target = self._parse_num_spec(spec)
+        def test_size(path, _cmp=cmp_op, _target=target, _mult=mult):
+            st = self._get_stat(path)
+            if st is None:
+                return False
+            # find's size calculation rounds up to the next block
+            return _cmp((st.st_size + _mult - 1) // _mult, _target)
+        return test_size
+
+    def _compile_perm(self, node):
+        """Compiles -perm with the octal mode and match style parsed once."""
+        spec = node.args[0]
+        if spec.startswith('-'):
+            # All of the permission bits in mode are set for the file.
+            bits = int(spec[1:], 8)
+            check = lambda mode, _bits=bits: (mode & _bits) == _bits
+        elif spec.startswith('/'):
+            # Any of the permission bits in mode are set for the file.
+            bits = int(spec[1:], 8)
+            check = lambda mode, _bits=bits: (mode & _bits) != 0
+        else:
+            # Exact match
+            bits = int(spec, 8)
+            check = lambda mode, _bits=bits: mode == _bits
+        def test_perm(path, _check=check):
+            st = self._get_stat(path, follow=True)
+            if st is None:
+                return False
+            return _check(stat.S_IMODE(st.st_mode))
+        return test_perm
+
+    def _compile_links(self, node):
+        """Compiles -links/-inum with the comparand parsed once.
+
+        Parsing at compile time also means a malformed number is reported
+        before the walk starts instead of erroring on the first file.
+        """
+        getter = operator.attrgetter(
+            'st_nlink' if node.name == '-links' else 'st_ino')
+        cmp_op, target = self._parse_num_spec(node.args[0])
+        def test_links(path, _get=getter, _cmp=cmp_op, _target=target):
+            st = self._get_stat(path, follow=True)
+            return st is not None and _cmp(_get(st), _target)
+        return test_links
+
+    def _compile_time(self, node):
+        """Compiles the -mtime/-atime/-ctime/-mmin/-amin/-cmin family.
+
+        The comparand is parsed once, so the per-file work is a cached
+        stat lookup and one integer comparison against the run's
+        reference timestamp.
+        """
+        attr, unit = self._time_attrs[node.name]
+        # attrgetter is C-implemented and avoids the string-keyed getattr
+        # lookup on every file.
+        getter = operator.attrgetter(attr)
+        cmp_op, target = self._parse_num_spec(node.args[0])
+        def test_time(path, _get=getter, _unit=unit, _cmp=cmp_op, _target=target):
+            st = self._get_stat(path, follow=True)
+            if st is None:
+                return False
+            return _cmp(int((self._now_ts - _get(st)) / _unit), _target)
+        return test_time
+
     def _get_num_args(self, op):
         """Returns the number of arguments for a given operator."""
         one_arg_ops = [
@@ -278,45 +964,43 @@ class FindMimic:
         return 0
 
     # --- Helper methods for tests ---
-    def _compare_num(self, val, target_str):
-        sign = ''
-        if target_str.startswith(('+', '-')):
-            sign = target_str[0]
-            target_str = target_str[1:]
-        
-        target = int(target_str)
-        if sign == '+': return val > target
-        if sign == '-': return val < target
-        return val == target
+    def _reference_time(self):
+        """Returns the timestamp file ages are measured against.
 
-    def _test_time(self, path, time_str, attr, unit_multiplier=86400):
-        now = datetime.now()
+        Plain time.time(), or the most recent local midnight under
+        -daystart; computed once per run so the time tests are pure float
+        arithmetic with no datetime objects in the per-file path.
+        """
+        now_ts = time.time()
         if self.options['daystart']:
-            now = now.replace(hour=0, minute=0, second=0, microsecond=0)
-        
-        try:
-            file_time = datetime.fromtimestamp(getattr(os.stat(path), attr))
-        except FileNotFoundError:
-            return False # File might have been deleted between os.walk and stat
-            
-        age_seconds = (now - file_time).total_seconds()
-        age_units = age_seconds / unit_multiplier
-
-        return self._compare_num(int(age_units), time_str)
+            lt = time.localtime(now_ts)
+            now_ts = time.mktime((lt.tm_year, lt.tm_mon, lt.tm_mday,
+                                  0, 0, 0, lt.tm_wday, lt.tm_yday, -1))
+        return now_ts
 
     # --- Tests ---
-    def _test_name(self, path, pattern): return fnmatch.fnmatch(os.path.basename(path), pattern)
-    def _test_iname(self, path, pattern): return fnmatch.fnmatch(os.path.basename(path).lower(), pattern.lower())
-    def _test_path(self, path, pattern): return fnmatch.fnmatch(path, pattern)
-    def _test_ipath(self, path, pattern): return fnmatch.fnmatch(path.lower(), pattern.lower())
-    def _test_regex(self, path, pattern): return re.search(pattern, path) is not None
-    def _test_iregex(self, path, pattern): return re.search(pattern, path, re.IGNORECASE) is not None
-    
+    # -name/-iname/-path/-ipath/-regex/-iregex are compiled into specialized
+    # closures by _compile_name/_compile_path/_compile_regex.
     def _test_type(self, path, type_chars):
-        try:
-            mode = os.lstat(path).st_mode
-        except FileNotFoundError:
+        # DirEntry type checks use the kernel-provided d_type when available,
+        # answering the common -type f/d/l cases without any stat syscall.
+        entry = self._current_entry
+        if entry is not None:
+            try:
+                if 'f' in type_chars and entry.is_file(follow_symlinks=False):
+                    return True
+                if 'd' in type_chars and entry.is_dir(follow_symlinks=False):
+                    return True
+                if 'l' in type_chars and entry.is_symlink():
+                    return True
+            except OSError:
+                return False
+            if not (set(type_chars) - {'f', 'd', 'l'}):
+                return False
+        st = self._get_stat(path)
+        if st is None:
             return False
+        mode = st.st_mode
         type_map = {
             'b': stat.S_ISBLK, 'c': stat.S_ISCHR, 'd': stat.S_ISDIR,
             'p': stat.S_ISFIFO, 'f': stat.S_ISREG, 'l': stat.S_ISLNK,
@@ -327,81 +1011,19 @@ class FindMimic:
                 return True
         return False
 
-    def _test_perm(self, path, mode_str):
-        try:
-            file_mode = stat.S_IMODE(os.stat(path).st_mode)
-        except FileNotFoundError:
-            return False
-            
-        if mode_str.startswith('-'):
-            # All of the permission bits in mode are set for the file.
-            mode = int(mode_str[1:], 8)
-            return (file_mode & mode) == mode
-        if mode_str.startswith('/'):
-            # Any of the permission bits in mode are set for the file.
-            mode = int(mode_str[1:], 8)
-            return (file_mode & mode) != 0
-        # Exact match
-        mode = int(mode_str, 8)
-        return file_mode == mode
-
-    def _test_size(self, path, size_str):
-        unit_map = {'c': 1, 'w': 2, 'k': 1024, 'M': 1024**2, 'G': 1024**3}
-        unit = size_str[-1]
-        if unit in unit_map:
-            target_val_str = size_str[:-1]
-            multiplier = unit_map[unit]
-        else:
-            target_val_str = size_str
-            multiplier = 512 # default blocks
-        
-        try:
-            file_size = os.lstat(path).st_size
-        except FileNotFoundError:
-            return False
-            
-        target_val_str_numeric = target_val_str.lstrip('+-')
-        
-        target_blocks = int(target_val_str_numeric)
-        
-        sign = ''
-        if target_val_str.startswith(('+', '-')):
-            sign = target_val_str[0]
-
-        # find's size calculation is based on rounding up to the next block
-        file_blocks = (file_size + multiplier - 1) // multiplier
-
-        if sign == '+': return file_blocks > target_blocks
-        if sign == '-': return file_blocks < target_blocks
-        return file_blocks == target_blocks
-
-    def _test_mtime(self, path, n): return self._test_time(path, n, 'st_mtime')
-    def _test_atime(self, path, n): return self._test_time(path, n, 'st_atime')
-    def _test_ctime(self, path, n): return self._test_time(path, n, 'st_ctime')
-    def _test_mmin(self, path, n): return self._test_time(path, n, 'st_mtime', 60)
-    def _test_amin(self, path, n): return self._test_time(path, n, 'st_atime', 60)
-    def _test_cmin(self, path, n): return self._test_time(path, n, 'st_ctime', 60)
-
     def _test_empty(self, path, *args):
-        try:
-            s = os.lstat(path)
-            if stat.S_ISDIR(s.st_mode):
-                return not os.listdir(path)
-            return stat.S_ISREG(s.st_mode) and s.st_size == 0
-        except (FileNotFoundError, OSError):
-            return False
-
-    def _test_links(self, path, n): 
-        try:
-            return self._compare_num(os.stat(path).st_nlink, n)
-        except FileNotFoundError:
-            return False
-            
-    def _test_inum(self, path, n): 
-        try:
-            return self._compare_num(os.stat(path).st_ino, n)
-        except FileNotFoundError:
+        s = self._get_stat(path)
+        if s is None:
             return False
+        if stat.S_ISDIR(s.st_mode):
+            # Probe for a single entry rather than materializing the whole
+            # listing: one readdir chunk answers the question.
+            try:
+                with os.scandir(path) as it:
+                    return next(it, None) is None
+            except OSError:
+                return False
+        return stat.S_ISREG(s.st_mode) and s.st_size == 0
 
     def _test_newer(self, path, file, attr='st_mtime'):
         try:
@@ -424,35 +1046,41 @@ class FindMimic:
 
     # --- Actions ---
     def _action_print(self, path, *args):
-        print(path)
+        self._write_out(os.fsencode(path) + b'\n')
         return True
 
     def _action_print0(self, path, *args):
-        sys.stdout.write(path + '\0')
-        sys.stdout.flush()
+        self._write_out(os.fsencode(path) + b'\0')
         return True
 
     def _action_ls(self, path, *args):
-        try:
-            st = os.lstat(path)
-        except FileNotFoundError:
+        st = self._get_stat(path)
+        if st is None:
             return True # Don't fail if file disappears
-            
+
         mode = stat.filemode(st.st_mode)
         nlink = st.st_nlink
-        try:
-            import pwd
-            uid = pwd.getpwuid(st.st_uid).pw_name
-        except (ImportError, KeyError):
-            uid = st.st_uid
-        try:
-            import grp
-            gid = grp.getgrgid(st.st_gid).gr_name
-        except (ImportError, KeyError):
-            gid = st.st_gid
+        uid = self._uid_cache.get(st.st_uid)
+        if uid is None:
+            try:
+                uid = pwd.getpwuid(st.st_uid).pw_name if pwd else st.st_uid
+            except KeyError:
+                uid = st.st_uid
+            self._uid_cache[st.st_uid] = uid
+        gid = self._gid_cache.get(st.st_gid)
+        if gid is None:
+            try:
+                gid = grp.getgrgid(st.st_gid).gr_name if grp else st.st_gid
+            except KeyError:
+                gid = st.st_gid
+            self._gid_cache[st.st_gid] = gid
         size = st.st_size
-        mtime = datetime.fromtimestamp(st.st_mtime).strftime('%b %d %H:%M')
-        
+        minute = int(st.st_mtime // 60)
+        mtime = self._ls_time_cache.get(minute)
+        if mtime is None:
+            mtime = datetime.fromtimestamp(st.st_mtime).strftime('%b %d %H:%M')
+            self._ls_time_cache[minute] = mtime
+
         # Format similar to `ls -dils`
         path_str = path
         if stat.S_ISLNK(st.st_mode):
@@ -461,7 +1089,8 @@ class FindMimic:
             except FileNotFoundError:
                 path_str += " -> [broken]"
 
-        print(f"{st.st_ino:6} {(st.st_blocks * 512) // 1024:4} {mode} {nlink:3} {uid:8} {gid:8} {size:8} {mtime} {path_str}")
+        line = f"{st.st_ino:6} {(st.st_blocks * 512) // 1024:4} {mode} {nlink:3} {uid:8} {gid:8} {size:8} {mtime} {path_str}\n"
+        self._write_out(os.fsencode(line))
         return True
 
     def _action_delete(self, path, *args):
@@ -476,9 +1105,11 @@ class FindMimic:
             return True # find continues after delete errors
 
     def _action_exec(self, path, command_parts, interactive=False, is_dir=False):
-        # Note: This is a simplified implementation. It does not handle '{} +'.
+        # The ';'-terminated form: one subprocess per path. The '{} +' form
+        # is handled by _action_exec_batch.
         cmd = [p.replace('{}', path) for p in command_parts]
-        
+        self._flush_output() # Keep our output ordered before the child's
+
         if interactive:
             prompt = f"< {' '.join(cmd)} > ? "
             try:
@@ -503,6 +1134,49 @@ class FindMimic:
             sys.stderr.write(f"find.py: exec failed for {cmd[0]}: {e}\n")
         return True
 
+    def _action_exec_batch(self, path, command_parts, is_dir=False):
+        """Queues path for a batched '-exec ... {} +' invocation.
+
+        Paths accumulate per command template (and per directory for
+        -execdir) and are handed to a single subprocess once the collected
+        argument bytes approach ARG_MAX; leftovers are flushed at the end
+        of the run. Like GNU find, the batched form always evaluates true.
+        """
+        if is_dir:
+            key = (tuple(command_parts), os.path.dirname(path) or '.')
+            arg = os.path.basename(path)
+        else:
+            key = (tuple(command_parts), None)
+            arg = path
+        batch = self._exec_batches.get(key)
+        if batch is None:
+            batch = self._exec_batches[key] = [[], 0]
+        batch[0].append(arg)
+        batch[1] += len(arg) + 1
+        if batch[1] >= self._exec_arg_max:
+            self._flush_exec_batch(key)
+        return True
+
+    def _action_execdir_batch(self, path, command_parts):
+        return self._action_exec_batch(path, command_parts, is_dir=True)
+
+    def _flush_exec_batch(self, key):
+        """Runs one pending batch: the template with the collected paths appended."""
+        batch = self._exec_batches.pop(key, None)
+        if batch is None or not batch[0]:
+            return
+        template, cwd = key
+        cmd = list(template) + batch[0]
+        self._flush_output() # Keep our output ordered before the child's
+        try:
+            subprocess.run(cmd, check=False, cwd=cwd)
+        except (subprocess.CalledProcessError, FileNotFoundError) as e:
+            sys.stderr.write(f"find.py: exec failed for {cmd[0]}: {e}\n")
+
+    def _flush_exec_batches(self):
+        for key in list(self._exec_batches):
+            self._flush_exec_batch(key)
+
     def _action_ok(self, path, command_parts):
         return self._action_exec(path, command_parts, interactive=True)
 
@@ -523,12 +1197,14 @@ class FindMimic:
 
     # --- Dispatch Tables ---
     _tests = {
-        '-name': _test_name, '-iname': _test_iname, '-path': _test_path, '-wholename': _test_path,
-        '-ipath': _test_ipath, '-iwholename': _test_ipath,
-        '-regex': _test_regex, '-iregex': _test_iregex, '-type': _test_type, '-perm': _test_perm,
-        '-size': _test_size, '-mtime': _test_mtime, '-atime': _test_atime, '-ctime': _test_ctime,
-        '-mmin': _test_mmin, '-amin': _test_amin, '-cmin': _test_cmin, '-empty': _test_empty,
-        '-links': _test_links, '-inum': _test_inum, '-newer': _test_newer, '-anewer': _test_anewer,
+        # None entries are recognized here but compiled by a specialized
+        # builder in _leaf_compilers instead of a generic dispatch call.
+        '-name': None, '-iname': None, '-path': None, '-wholename': None,
+        '-ipath': None, '-iwholename': None,
+        '-regex': None, '-iregex': None, '-type': _test_type, '-perm': None,
+        '-size': None, '-mtime': None, '-atime': None, '-ctime': None,
+        '-mmin': None, '-amin': None, '-cmin': None, '-empty': _test_empty,
+        '-links': None, '-inum': None, '-newer': _test_newer, '-anewer': _test_anewer,
         '-cnewer': _test_cnewer, '-readable': _test_readable, '-writable': _test_writable,
         '-executable': _test_executable, '-true': _test_true, '-false': _test_false,
     }
@@ -538,6 +1214,41 @@ class FindMimic:
         '-execdir': _action_execdir, '-okdir': _action_okdir,
         '-prune': _action_prune, '-quit': _action_quit,
     }
+    _batched_actions = {
+        '-exec': _action_exec_batch, '-execdir': _action_execdir_batch,
+    }
+    _leaf_compilers = {
+        '-name': _compile_name, '-iname': _compile_name,
+        '-path': _compile_path, '-wholename': _compile_path,
+        '-ipath': _compile_path, '-iwholename': _compile_path,
+        '-regex': _compile_regex, '-iregex': _compile_regex,
+        '-size': _compile_size, '-perm': _compile_perm,
+        '-links': _compile_links, '-inum': _compile_links,
+        '-mtime': _compile_time, '-atime': _compile_time, '-ctime': _compile_time,
+        '-mmin': _compile_time, '-amin': _compile_time, '-cmin': _compile_time,
+    }
+    # Estimated per-path cost per test primary: pure string tests are
+    # nearly free, -type usually answers from the DirEntry, and anything
+    # absent here needs a stat or access syscall.
+    _test_costs = {
+        '-true': 0, '-false': 0,
+        '-name': 1, '-iname': 1, '-path': 1, '-wholename': 1,
+        '-ipath': 1, '-iwholename': 1,
+        '-regex': 2, '-iregex': 2,
+        '-type': 3,
+    }
+    # (stat attribute, unit seconds) per time-test primary.
+    _time_attrs = {
+        '-mtime': ('st_mtime', 86400), '-atime': ('st_atime', 86400),
+        '-ctime': ('st_ctime', 86400), '-mmin': ('st_mtime', 60),
+        '-amin': ('st_atime', 60), '-cmin': ('st_ctime', 60),
+    }
+    # Primaries whose evaluation requires a stat result.
+    _stat_consumers = frozenset((
+        '-type', '-perm', '-size', '-mtime', '-atime', '-ctime', '-mmin',
+        '-amin', '-cmin', '-empty', '-links', '-inum', '-newer', '-anewer',
+        '-cnewer', '-ls',
+    ))
 
 def main():
     """